@@ -6,7 +6,7 @@ import logging
 import re
 from collections import OrderedDict
 from functools import lru_cache
-from typing import Any, Dict, Final, Optional
+from typing import Any, Dict, Final, Optional, Tuple
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import aws, azure, google
@@ -19,6 +19,20 @@ TEMPLATE_STR_REGEX: Final[re.Pattern] = re.compile(
 )
 
 
+@lru_cache(maxsize=256)
+def _find_config_variables(template_str: str) -> Tuple[Tuple[str, str], ...]:
+    """Return the (matched pattern, config variable name) pairs found in `template_str`.
+
+    Config strings are substituted every time a config is loaded or an engine is created, so the
+    parsed result is cached. Only the parsing is cached, the variable values may change.
+    """
+    return tuple(
+        # Match either the first group e.g. ${Variable} or the second e.g. $Variable
+        (m.group(), m.group(1) or m.group(2))
+        for m in TEMPLATE_STR_REGEX.finditer(template_str)
+    )
+
+
 class _ConfigurationSubstitutor:
     """
     Responsible for encapsulating all logic around $VARIABLE (or ${VARIABLE}) substitution.
@@ -110,22 +124,21 @@ class _ConfigurationSubstitutor:
         if template_str is None:
             return template_str
 
-        # 1. Make substitutions for non-escaped patterns
-        try:
-            match = re.finditer(TEMPLATE_STR_REGEX, template_str)
-        except TypeError:
+        if not isinstance(template_str, str):
             # If the value is not a string (e.g., a boolean), we should return it as is
             return template_str
 
-        for m in match:
-            # Match either the first group e.g. ${Variable} or the second e.g. $Variable
-            config_variable_name = m.group(1) or m.group(2)
+        # 1. Make substitutions for non-escaped patterns
+        # Only strings with a "$" can hold a pattern, skip the cache for all the others
+        config_variables = _find_config_variables(template_str) if "$" in template_str else ()
+
+        for matched_pattern, config_variable_name in config_variables:
             config_variable_value = config_variables_dict.get(config_variable_name)
 
             if config_variable_value is not None:
                 if not isinstance(config_variable_value, str):
                     return config_variable_value
-                template_str = template_str.replace(m.group(), config_variable_value)
+                template_str = template_str.replace(matched_pattern, config_variable_value)
             else:
                 raise gx_exceptions.MissingConfigVariableError(  # noqa: TRY003
                     f"""\n\nUnable to find a match for config substitution variable: `{config_variable_name}`.
@@ -5,6 +5,7 @@ import logging
 import warnings
 from datetime import date, datetime
 from pprint import pformat as pf
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -14,6 +15,7 @@ from typing import (
     Generic,
     List,
     Literal,
+    Mapping,
     Optional,
     Protocol,
     Sequence,
@@ -305,7 +307,7 @@ class _PartitionerOneColumnOneParam(FluentBaseModel):
         return params
 
     @property
-    def param_names(self) -> list[str]:
+    def param_names(self) -> Sequence[str]:
         raise NotImplementedError
 
     def partitioner_method_kwargs(self) -> Dict[str, Any]:
@@ -425,6 +427,14 @@ class SqlPartitionerMultiColumnValue(FluentBaseModel):
         )
 
 
+# The datetime parameter will be a string representing a datetime in the format
+# given by SqlitePartitionerConvertedDateTime.date_format_string.
+_DATETIME_PARAM_NAME: Final[str] = "datetime"
+_PARAM_NAMES: Final[Tuple[str, ...]] = (_DATETIME_PARAM_NAME,)
+
+_MISSING: Final = object()  # sentinel value to indicate missing values
+
+
 class SqlitePartitionerConvertedDateTime(_PartitionerOneColumnOneParam):
     """A partitioner than can be used for sql engines that represents datetimes as strings.
 
@@ -433,6 +443,10 @@ class SqlitePartitionerConvertedDateTime(_PartitionerOneColumnOneParam):
     The DatetimePartitioner will also work for SQLite and may be more intuitive.
     """
 
+    class Config:
+        # partitioners are never mutated after they are created
+        frozen = True
+
     # date_format_strings syntax is documented here:
     # https://docs.python.org/3/library/datetime.html#strftime-and-strptime-format-codes
     # It allows for arbitrary strings so can't be validated until conversion time.
@@ -443,10 +457,8 @@ class SqlitePartitionerConvertedDateTime(_PartitionerOneColumnOneParam):
 
     @property
     @override
-    def param_names(self) -> List[str]:
-        # The datetime parameter will be a string representing a datetime in the format
-        # given by self.date_format_string.
-        return ["datetime"]
+    def param_names(self) -> Tuple[str, ...]:
+        return _PARAM_NAMES
 
     @override
     def partitioner_method_kwargs(self) -> Dict[str, Any]:
@@ -459,11 +471,12 @@ class SqlitePartitionerConvertedDateTime(_PartitionerOneColumnOneParam):
     def batch_parameters_to_batch_spec_kwarg_identifiers(
         self, options: BatchParameters
     ) -> Dict[str, Any]:
-        if "datetime" not in options:
+        datetime_value = options.get(_DATETIME_PARAM_NAME, _MISSING)
+        if datetime_value is _MISSING:
             raise ValueError(  # noqa: TRY003
                 "'datetime' must be specified in the batch parameters to create a batch identifier"
             )
-        return {self.column_name: options["datetime"]}
+        return {self.column_name: datetime_value}
 
 
 # We create this type instead of using _Partitioner so pydantic can use to this to
@@ -494,10 +507,11 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
     # Instance fields
     type: str = pydantic.Field("_sql_asset")
     name: str
-    _partitioner_implementation_map: Dict[
-        Type[ColumnPartitioner], Optional[Type[SqlPartitioner]]
-    ] = pydantic.PrivateAttr(
-        default={
+    # Subclasses for specific backends override this with a copy that adds their partitioners.
+    _partitioner_implementation_map: ClassVar[
+        Mapping[Type[ColumnPartitioner], Optional[Type[SqlPartitioner]]]
+    ] = MappingProxyType(
+        {
             ColumnPartitionerYearly: SqlPartitionerYear,
             ColumnPartitionerMonthly: SqlPartitionerYearAndMonth,
             ColumnPartitionerDaily: SqlPartitionerYearAndMonthAndDay,
@@ -1057,14 +1071,30 @@ class SQLDatasource(Datasource):
             exclude=self._get_exec_engine_excludes(),
             config_provider=self._config_provider,
         )
-        _check_config_substitutions_needed(
-            self, model_dict, raise_warning_if_provider_not_present=True
-        )
+        if self._may_need_config_substitutions():
+            _check_config_substitutions_needed(
+                self, model_dict, raise_warning_if_provider_not_present=True
+            )
         # the connection_string has had config substitutions applied
         connection_string = model_dict.pop("connection_string")
         if self.__class__.__name__ == "SQLDatasource":
             _warn_for_more_specific_datasource_type(connection_string)
         kwargs = model_dict.pop("kwargs", {})
+        return self._build_engine(connection_string, kwargs)
+
+    def _may_need_config_substitutions(self) -> bool:
+        """Whether any field used to create the engine can hold a config template.
+
+        Subclasses that know which of their fields can be `ConfigStr`s override this to skip the
+        substitution check.
+        """
+        return True
+
+    def _build_engine(self, connection_string: str, kwargs: dict[str, Any]) -> sqlalchemy.Engine:
+        """Create the engine from the substituted connection string and engine kwargs.
+
+        Backend specific datasources override this to customize how their engines are created.
+        """
         return sa.create_engine(connection_string, **kwargs)
 
     @override
@@ -1084,13 +1114,21 @@ class SQLDatasource(Datasource):
             or not self._execution_engine
         ):
             self._cached_execution_engine_kwargs = current_execution_engine_kwargs
-            engine_kwargs = current_execution_engine_kwargs.pop("kwargs", {})
-            self._execution_engine = self._execution_engine_type()(
-                **current_execution_engine_kwargs,
-                **engine_kwargs,
+            # pass a copy, the cached kwargs must keep the "kwargs" key that is popped off of it
+            self._execution_engine = self._create_execution_engine(
+                dict(current_execution_engine_kwargs)
             )
         return self._execution_engine
 
+    def _create_execution_engine(
+        self, execution_engine_kwargs: dict[str, Any]
+    ) -> SqlAlchemyExecutionEngine:
+        engine_kwargs = execution_engine_kwargs.pop("kwargs", {})
+        return self._execution_engine_type()(
+            **execution_engine_kwargs,
+            **engine_kwargs,
+        )
+
     @override
     def test_connection(self, test_assets: bool = True) -> None:
         """Test the connection for the SQLDatasource.
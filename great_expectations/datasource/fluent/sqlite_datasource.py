@@ -1,20 +1,25 @@
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
-    Dict,
+    Final,
     List,
     Literal,
+    Mapping,
     Optional,
     Type,
     Union,
     cast,
 )
 
+from typing_extensions import Annotated
+
 from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility import pydantic
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.partitioners import (
     PartitionerConvertedDatetime,
@@ -26,7 +31,6 @@ from great_expectations.datasource.fluent.sql_datasource import (
 from great_expectations.datasource.fluent.sql_datasource import (
     SQLDatasource,
     SqlitePartitionerConvertedDateTime,
-    _PartitionerOneColumnOneParam,
 )
 from great_expectations.datasource.fluent.sql_datasource import (
     TableAsset as SqlTableAsset,
@@ -35,92 +39,125 @@ from great_expectations.datasource.fluent.sql_datasource import (
 if TYPE_CHECKING:
     # min version of typing_extension missing `Self`, so it can't be imported at runtime
 
+    from great_expectations.compatibility import sqlalchemy
+    from great_expectations.core.partitioners import ColumnPartitioner
     from great_expectations.datasource.fluent.interfaces import (
         BatchMetadata,
-        BatchParameters,
         DataAsset,
     )
+    from great_expectations.datasource.fluent.sql_datasource import SqlPartitioner
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
 
 # This module serves as an example of how to extend _SQLAssets for specific backends. The steps are:
-# 1. Create a plain class with the extensions necessary for the specific backend.
-# 2. Make 2 classes XTableAsset and XQueryAsset by mixing in the class created in step 1 with
-#    sql_datasource.TableAsset and sql_datasource.QueryAsset.
+# 1. Implement the backend specific partitioners in sql_datasource, e.g.
+#    SqlitePartitionerConvertedDateTime.
+# 2. Make 2 classes XTableAsset and XQueryAsset that subclass sql_datasource.TableAsset and
+#    sql_datasource.QueryAsset, and map the core partitioners to the partitioners from step 1 in
+#    their `_partitioner_implementation_map`.
 #
 # See SqliteDatasource, SqliteTableAsset, and SqliteQueryAsset below.
 
+# Connection level pragmas that speed up read heavy metric queries.
+# They don't change the database file (unlike `journal_mode=WAL`) so they are safe to use with
+# read-only databases, and they don't weaken the durability of writes (unlike `synchronous=NORMAL`).
+_SQLITE_CONNECTION_PRAGMAS: Final[tuple[str, ...]] = (
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+)
 
-class PartitionerConvertedDateTime(_PartitionerOneColumnOneParam):
-    """A partitioner than can be used for sql engines that represents datetimes as strings.
 
-    The SQL engine that this currently supports is SQLite since it stores its datetimes as
-    strings.
-    The DatetimePartitioner will also work for SQLite and may be more intuitive.
-    """
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_CONNECTION_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
-    # date_format_strings syntax is documented here:
-    # https://docs.python.org/3/library/datetime.html#strftime-and-strptime-format-codes
-    # It allows for arbitrary strings so can't be validated until conversion time.
-    date_format_string: str
-    column_name: str
-    method_name: Literal["partition_on_converted_datetime"] = "partition_on_converted_datetime"
 
-    @property
-    @override
-    def param_names(self) -> List[str]:
-        # The datetime parameter will be a string representing a datetime in the format
-        # given by self.date_format_string.
-        return ["datetime"]
+class SqliteDsn(str):
+    """A sqlite SQLAlchemy connection string.
 
-    @override
-    def partitioner_method_kwargs(self) -> Dict[str, Any]:
-        return {
-            "column_name": self.column_name,
-            "date_format_string": self.date_format_string,
+    Only the scheme is validated here, the rest of the URL is parsed by SQLAlchemy when the
+    engine is created. This avoids the regex parsing done by `pydantic.AnyUrl`.
+    """
+
+    allowed_schemes: ClassVar[frozenset[str]] = frozenset(
+        {
+            "sqlite",
+            "sqlite+pysqlite",
+            "sqlite+aiosqlite",
+            "sqlite+pysqlcipher",
         }
+    )
+    min_length: ClassVar[int] = 1
+    max_length: ClassVar[int] = 2**16
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Any) -> SqliteDsn:
+        if not isinstance(value, str):
+            raise pydantic.errors.StrError()
+        value = value.strip()
+        if len(value) < cls.min_length:
+            raise pydantic.errors.AnyStrMinLengthError(limit_value=cls.min_length)
+        if len(value) > cls.max_length:
+            raise pydantic.errors.AnyStrMaxLengthError(limit_value=cls.max_length)
+        scheme, separator, _ = value.partition(":")
+        if not separator:
+            raise pydantic.errors.UrlSchemeError()
+        if scheme.lower() not in cls.allowed_schemes:
+            raise pydantic.errors.UrlSchemePermittedError(set(cls.allowed_schemes))
+        return cls(value)
 
-    @override
-    def batch_parameters_to_batch_spec_kwarg_identifiers(
-        self, options: BatchParameters
-    ) -> Dict[str, Any]:
-        if "datetime" not in options:
-            raise ValueError(  # noqa: TRY003
-                "'datetime' must be specified in the batch parameters to create a batch identifier"
-            )
-        return {self.column_name: options["datetime"]}
-
-
-class SqliteDsn(pydantic.AnyUrl):
-    allowed_schemes = {
-        "sqlite",
-        "sqlite+pysqlite",
-        "sqlite+aiosqlite",
-        "sqlite+pysqlcipher",
-    }
-    host_required = False
+    @property
+    def scheme(self) -> str:
+        return self.partition(":")[0]
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: dict) -> None:
+        """Update the generated schema when used in a pydantic model."""
+        field_schema.update(minLength=cls.min_length, maxLength=cls.max_length, format="uri")
 
 
 class SqliteTableAsset(SqlTableAsset):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # update the partitioner map with the Sqlite specific partitioner
-        self._partitioner_implementation_map[PartitionerConvertedDatetime] = (
-            SqlitePartitionerConvertedDateTime
-        )
+    # update the partitioner map with the Sqlite specific partitioner
+    _partitioner_implementation_map: ClassVar[
+        Mapping[Type[ColumnPartitioner], Optional[Type[SqlPartitioner]]]
+    ] = MappingProxyType(
+        {
+            **SqlTableAsset._partitioner_implementation_map,
+            PartitionerConvertedDatetime: SqlitePartitionerConvertedDateTime,
+        }
+    )
 
     type: Literal["table"] = "table"
 
 
 class SqliteQueryAsset(SqlQueryAsset):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # update the partitioner map with the  Sqlite specific partitioner
-        self._partitioner_implementation_map[PartitionerConvertedDatetime] = (
-            SqlitePartitionerConvertedDateTime
-        )
+    # update the partitioner map with the Sqlite specific partitioner
+    _partitioner_implementation_map: ClassVar[
+        Mapping[Type[ColumnPartitioner], Optional[Type[SqlPartitioner]]]
+    ] = MappingProxyType(
+        {
+            **SqlQueryAsset._partitioner_implementation_map,
+            PartitionerConvertedDatetime: SqlitePartitionerConvertedDateTime,
+        }
+    )
 
     type: Literal["query"] = "query"
 
 
+# Parse asset configs straight into the Sqlite asset types, dispatching on `type`, so they
+# don't have to be re-validated as a more specific type by `Datasource._load_asset_subtype()`
+SqliteAssetTypes = Annotated[
+    Union[SqliteTableAsset, SqliteQueryAsset], pydantic.Field(discriminator="type")
+]
+
+
 @public_api
 class SqliteDatasource(SQLDatasource):
     """Adds a sqlite datasource to the data context.
@@ -142,10 +179,40 @@ class SqliteDatasource(SQLDatasource):
     # left side enforces the names on instance creation
     type: Literal["sqlite"] = "sqlite"  # type: ignore[assignment]
     connection_string: Union[ConfigStr, SqliteDsn]
+    assets: List[SqliteAssetTypes] = []  # type: ignore[assignment]
 
     _TableAsset: Type[SqlTableAsset] = pydantic.PrivateAttr(SqliteTableAsset)
     _QueryAsset: Type[SqlQueryAsset] = pydantic.PrivateAttr(SqliteQueryAsset)
 
+    @override
+    def _may_need_config_substitutions(self) -> bool:
+        # connection_string is the only top level field that can hold a config template
+        return isinstance(self.connection_string, ConfigStr)
+
+    @override
+    def _build_engine(self, connection_string: str, kwargs: dict[str, Any]) -> sqlalchemy.Engine:
+        engine = super()._build_engine(connection_string, kwargs)
+        sa.event.listen(engine, "connect", _set_sqlite_pragmas)
+        return engine
+
+    @override
+    def _create_execution_engine(
+        self, execution_engine_kwargs: dict[str, Any]
+    ) -> SqlAlchemyExecutionEngine:
+        engine_kwargs = execution_engine_kwargs.pop("kwargs", {})
+        # The execution engine gets its own engine, so closing it doesn't dispose the datasource
+        # engine. Like SqlAlchemyExecutionEngine does for sqlite, it uses a single connection
+        # because temp tables only live as long as their connection.
+        engine = self._build_engine(
+            execution_engine_kwargs["connection_string"],
+            {"poolclass": sa.pool.StaticPool, **engine_kwargs},
+        )
+        return self._execution_engine_type()(
+            **execution_engine_kwargs,
+            **engine_kwargs,
+            engine=engine,
+        )
+
     @public_api
     @override
     def add_table_asset(
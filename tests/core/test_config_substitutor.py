@@ -317,3 +317,29 @@ def test_substitute_value_from_azure_keyvault(
                 )
                 == expected
             )
+
+
+@pytest.mark.unit
+def test_substitute_config_variable_uses_current_values_for_repeated_templates(
+    config_substitutor,
+):
+    template_str = "sqlite:///${DB_DIR}/$DB_NAME.db"
+
+    assert (
+        config_substitutor.substitute_config_variable(
+            template_str, {"DB_DIR": "data", "DB_NAME": "first"}
+        )
+        == "sqlite:///data/first.db"
+    )
+    assert (
+        config_substitutor.substitute_config_variable(
+            template_str, {"DB_DIR": "other_data", "DB_NAME": "second"}
+        )
+        == "sqlite:///other_data/second.db"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", [True, 1, {"key": "${VALUE}"}])
+def test_substitute_config_variable_returns_non_string_values_as_is(config_substitutor, value):
+    assert config_substitutor.substitute_config_variable(value, {"VALUE": "value"}) == value
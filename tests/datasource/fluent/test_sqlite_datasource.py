@@ -7,10 +7,21 @@ from typing import TYPE_CHECKING, Any, Callable, Generator, Optional
 import pytest
 
 from great_expectations.compatibility.pydantic import ValidationError
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.core.partitioners import (
     PartitionerConvertedDatetime,
 )
 from great_expectations.datasource.fluent import SqliteDatasource
+from great_expectations.datasource.fluent.sql_datasource import (
+    QueryAsset,
+    SqlitePartitionerConvertedDateTime,
+    TableAsset,
+)
+from great_expectations.datasource.fluent.sqlite_datasource import (
+    SqliteDsn,
+    SqliteQueryAsset,
+    SqliteTableAsset,
+)
 from tests.datasource.fluent.conftest import sqlachemy_execution_engine_mock_cls
 
 if TYPE_CHECKING:
@@ -56,6 +67,26 @@ def test_connection_string_starts_with_sqlite(
     assert sqlite_datasource.connection_string == f"sqlite:///{sqlite_database_path}"
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "scheme", ["sqlite", "sqlite+pysqlite", "sqlite+aiosqlite", "sqlite+pysqlcipher", "SQLITE"]
+)
+def test_connection_string_allowed_schemes(scheme: str):
+    connection_string = f"{scheme}:///path/to/database/file.db"
+    datasource = SqliteDatasource(name="sqlite_datasource", connection_string=connection_string)
+    assert isinstance(datasource.connection_string, SqliteDsn)
+    assert datasource.connection_string == connection_string
+    assert datasource.connection_string.scheme == scheme
+
+
+@pytest.mark.unit
+def test_empty_connection_string():
+    with pytest.raises(ValidationError) as e:
+        SqliteDatasource(name="sqlite_datasource", connection_string="")
+    # the first error is due to missing a config template string
+    assert e.value.errors()[1]["msg"] == "ensure this value has at least 1 characters"
+
+
 @pytest.mark.unit
 def test_connection_string_that_does_not_start_with_sqlite():
     name = "sqlite_datasource"
@@ -77,6 +108,49 @@ def test_connection_string_that_does_not_start_with_sqlite():
     }
 
 
+@pytest.mark.unit
+def test_execution_engine_is_reused(sqlite_datasource):
+    assert sqlite_datasource.get_execution_engine() is sqlite_datasource.get_execution_engine()
+
+
+@pytest.mark.unit
+def test_closing_execution_engine_keeps_datasource_engine(sqlite_datasource):
+    engine = sqlite_datasource.get_engine()
+    execution_engine = sqlite_datasource.get_execution_engine()
+    assert execution_engine.engine is not engine
+    execution_engine.close()
+    assert sqlite_datasource.get_engine() is engine
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ["pragma", "expected_value"],
+    [
+        ("cache_size", -64000),
+        ("temp_store", 2),  # MEMORY
+    ],
+)
+def test_execution_engine_connections_set_pragmas(
+    sqlite_datasource, pragma: str, expected_value: int
+):
+    execution_engine = sqlite_datasource.get_execution_engine()
+    with execution_engine.engine.connect() as connection:
+        assert connection.execute(sa.text(f"PRAGMA {pragma}")).scalar() == expected_value
+
+
+@pytest.mark.unit
+def test_assets_are_loaded_as_sqlite_assets():
+    datasource = SqliteDatasource(
+        name="sqlite_datasource",
+        connection_string="sqlite://",
+        assets=[
+            {"name": "my_table_asset", "type": "table", "table_name": "my_table"},
+            {"name": "my_query_asset", "type": "query", "query": "SELECT * FROM my_table"},
+        ],
+    )
+    assert [type(asset) for asset in datasource.assets] == [SqliteTableAsset, SqliteQueryAsset]
+
+
 @pytest.mark.unit
 def test_non_select_query_asset(sqlite_datasource):
     with pytest.raises(ValueError):
@@ -173,6 +247,21 @@ def test_sqlite_specific_partitioner(
         assert specified_batches[-1].metadata == last_specified_batch_metadata
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ["sqlite_asset_class", "sql_asset_class"],
+    [(SqliteTableAsset, TableAsset), (SqliteQueryAsset, QueryAsset)],
+)
+def test_converted_datetime_partitioner_only_registered_for_sqlite_assets(
+    sqlite_asset_class, sql_asset_class
+):
+    assert (
+        sqlite_asset_class._partitioner_implementation_map[PartitionerConvertedDatetime]
+        is SqlitePartitionerConvertedDateTime
+    )
+    assert sql_asset_class._partitioner_implementation_map[PartitionerConvertedDatetime] is None
+
+
 @pytest.mark.unit
 def test_create_temp_table(empty_data_context, create_sqlite_source):
     with create_sqlite_source(data_context=empty_data_context, create_temp_table=False) as source:
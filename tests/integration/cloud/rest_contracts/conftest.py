@@ -191,7 +191,7 @@ class ContractInteraction(pydantic.BaseModel):
     request_params: Union[dict, None] = None
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def run_rest_api_pact_test(
     gx_cloud_session: Session,
     pact_test: pact.Pact,
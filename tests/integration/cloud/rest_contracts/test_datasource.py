@@ -19,6 +19,13 @@ NON_EXISTENT_DATASOURCE_ID: Final[str] = "6ed9a340-8469-4ee2-a300-ffbe5d09b49d"
 
 EXISTING_DATASOURCE_ID: Final[str] = "15da041b-328e-44f7-892e-2bfd1a887ef8"
 
+DATASOURCES_PATH: Final[pathlib.Path] = pathlib.Path(
+    "/",
+    "organizations",
+    EXISTING_ORGANIZATION_ID,
+    "datasources",
+)
+
 
 POST_DATASOURCE_MIN_RESPONSE_BODY: Final[PactBody] = {
     "data": pact.Like(
@@ -52,12 +59,7 @@ GET_DATASOURCE_MIN_RESPONSE_BODY: Final[PactBody] = {
     [
         # ContractInteraction(
         #     method="POST",
-        #     request_path=pathlib.Path(
-        #         "/",
-        #         "organizations",
-        #         EXISTING_ORGANIZATION_ID,
-        #         "datasources",
-        #     ),
+        #     request_path=DATASOURCES_PATH,
         #     upon_receiving="a request to add a Data Source",
         #     given="the Data Source does not exist",
         #     response_status=200,
@@ -65,13 +67,7 @@ GET_DATASOURCE_MIN_RESPONSE_BODY: Final[PactBody] = {
         # ),
         ContractInteraction(
             method="GET",
-            request_path=pathlib.Path(
-                "/",
-                "organizations",
-                EXISTING_ORGANIZATION_ID,
-                "datasources",
-                EXISTING_DATASOURCE_ID,
-            ),
+            request_path=DATASOURCES_PATH / EXISTING_DATASOURCE_ID,
             upon_receiving="a request to get a Data Source",
             given="the Data Source exists",
             response_status=200,